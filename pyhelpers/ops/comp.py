@@ -2,7 +2,6 @@
 Basic computation/conversion.
 """
 
-import copy
 import datetime
 import math
 import os
@@ -15,6 +14,21 @@ import requests
 
 from .._cache import _print_failure_message
 
+# Prefixes of the units of size, and the corresponding binary and decimal (or metric) units
+_UNITS_PREFIXES = ('K', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y')
+_BIN_UNITS = tuple(x + 'iB' for x in _UNITS_PREFIXES)
+_DEC_UNITS = tuple(x + 'B' for x in _UNITS_PREFIXES)
+# Powers of the binary and decimal factors, from 'B' to 'YiB'/'YB'
+_BIN_POWERS = tuple((2 ** 10) ** i for i in range(len(_UNITS_PREFIXES) + 1))
+_DEC_POWERS = tuple((10 ** 3) ** i for i in range(len(_UNITS_PREFIXES) + 1))
+# Mappings from the first letter of a unit to its multiplier (in byte)
+_BIN_MULT = dict(zip(_UNITS_PREFIXES, _BIN_POWERS[1:]))
+_DEC_MULT = dict(zip(_UNITS_PREFIXES, _DEC_POWERS[1:]))
+
+# GPS epoch (6 January 1980) and GPS - TAI offset (19 seconds from the GPS epoch)
+_GPS_EPOCH = datetime.datetime(1980, 1, 6, 0, 0, 0)
+_GPS_TAI_OFFSET = 19
+
 
 def get_utc_tai_offset(verbose=False, raise_error=False, url=None):
     """
@@ -70,6 +84,34 @@ def get_utc_tai_offset(verbose=False, raise_error=False, url=None):
             raise_error=raise_error)
 
 
+def _get_gps_utc_offset(utc_tai_offset=None):
+    """
+    Gets the total offset (in seconds) for converting GPS time to UTC time.
+
+    :param utc_tai_offset: The difference between UTC and TAI, i.e. UTC - TAI;
+        if ``utc_tai_offset=None`` (default), it is retrieved by
+        :func:`~pyhelpers.ops.get_utc_tai_offset`, falling back to ``-37`` on failure.
+    :type utc_tai_offset: float | int | None
+    :return: Offset from GPS time to UTC time.
+    :rtype: float | int
+
+    **Tests**::
+
+        >>> from pyhelpers.ops.comp import _get_gps_utc_offset
+        >>> _get_gps_utc_offset(utc_tai_offset=-37)
+        -18
+    """
+
+    if utc_tai_offset is None:
+        # noinspection PyBroadException
+        try:
+            utc_tai_offset = get_utc_tai_offset(raise_error=True)
+        except Exception:
+            utc_tai_offset = -37  # As of December 2024
+
+    return _GPS_TAI_OFFSET + utc_tai_offset
+
+
 def gps_time_to_utc(gps_time, as_datetime=True, utc_tai_offset=None):
     # noinspection PyShadowingNames
     """
@@ -98,22 +140,10 @@ def gps_time_to_utc(gps_time, as_datetime=True, utc_tai_offset=None):
         >>> '2020-04-20T06:22:47.782251'
     """
 
-    gps_epoch = datetime.datetime(1980, 1, 6, 0, 0, 0)
-
-    # GPS - TAI offset (19 seconds from the GPS epoch)
-    gps_tai_offset = 19
-
-    if utc_tai_offset is None:
-        # noinspection PyBroadException
-        try:
-            utc_tai_offset = get_utc_tai_offset(raise_error=True)
-        except Exception:
-            utc_tai_offset = -37  # As of December 2024
-
     # Total offset: GPS to UTC
-    total_offset = gps_tai_offset + utc_tai_offset
+    total_offset = _get_gps_utc_offset(utc_tai_offset)
 
-    utc_time = gps_epoch + datetime.timedelta(seconds=(gps_time + total_offset))
+    utc_time = _GPS_EPOCH + datetime.timedelta(seconds=(gps_time + total_offset))
 
     if not as_datetime:
         utc_time = utc_time.isoformat()  # Alternatively, utc_time.strftime("%Y-%m-%d %H:%M:%S.%f")
@@ -121,6 +151,55 @@ def gps_time_to_utc(gps_time, as_datetime=True, utc_tai_offset=None):
     return utc_time
 
 
+def gps_times_to_utc(gps_times, as_datetime=True, utc_tai_offset=None):
+    # noinspection PyShadowingNames
+    """
+    Converts an array of GPS times to UTC times.
+
+    This is a vectorised counterpart of :func:`~pyhelpers.ops.gps_time_to_utc`, which is more
+    efficient for converting a large number of GPS times.
+
+    :param gps_times: Array-like object of standard GPS times in seconds since GPS epoch
+        (6 January 1980).
+    :type gps_times: numpy.ndarray | list | tuple
+    :param as_datetime: If ``True``, the function returns the UTC times as an array of
+        ``numpy.datetime64``; otherwise an array of strings; defaults to ``True``.
+    :type as_datetime: bool
+    :param utc_tai_offset: The difference between UTC (Coordinated Universal Time) and
+        the TAI (International Atomic Time), i.e. UTC - TAI; defaults to ``None``.
+    :type utc_tai_offset: float | int | None
+    :return: UTC times corresponding to the GPS times (with a precision of microseconds).
+    :rtype: numpy.ndarray
+
+    **Examples**::
+
+        >>> from pyhelpers.ops import gps_times_to_utc
+        >>> gps_times = [1271398985.7822514, 1271398986.7822514]
+        >>> utc_times = gps_times_to_utc(gps_times)
+        >>> utc_times
+        array(['2020-04-20T06:22:47.782251', '2020-04-20T06:22:48.782251'],
+              dtype='datetime64[us]')
+        >>> utc_times = gps_times_to_utc(gps_times, as_datetime=False)
+        >>> utc_times
+        array(['2020-04-20T06:22:47.782251', '2020-04-20T06:22:48.782251'],
+              dtype='<U45')
+    """
+
+    total_offset = _get_gps_utc_offset(utc_tai_offset)
+
+    # Scale whole seconds and fractions separately to avoid rounding errors in microseconds
+    elapsed = np.asarray(gps_times, dtype=np.float64) + total_offset
+    seconds = np.floor(elapsed)
+    microseconds = (
+        seconds.astype(np.int64) * 10 ** 6 + np.rint((elapsed - seconds) * 1e6).astype(np.int64))
+    utc_times = np.datetime64(_GPS_EPOCH, 'us') + microseconds.astype('timedelta64[us]')
+
+    if not as_datetime:
+        utc_times = np.datetime_as_string(utc_times, unit='us')
+
+    return utc_times
+
+
 def parse_size(size, binary=True, precision=1):
     """
     Parses size into human-readable format or vice versa.
@@ -157,33 +236,94 @@ def parse_size(size, binary=True, precision=1):
         '129.45 MB'
     """
 
-    min_unit, units_prefixes = 'B', ['K', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y']
+    if isinstance(size, str):
+        val, sym = size.split(None, 1)
+        sym = sym.rstrip()
+        # If a binary unit (e.g. 'MiB') is specified, it takes precedence over `binary`
+        is_binary = binary is True or sym[-2:].lower() == 'ib'
+        multipliers = _BIN_MULT if is_binary else _DEC_MULT
+        parsed_size = int(float(val) * multipliers[sym[0].upper()])  # in byte
+
+    else:
+        min_unit = 'B'
+        if binary is True:  # Binary system
+            factor, units, powers = 2 ** 10, _BIN_UNITS, _BIN_POWERS
+        else:  # Decimal (or metric) system
+            factor, units, powers = 10 ** 3, _DEC_UNITS, _DEC_POWERS
+
+        temp_size = abs(size)
+
+        # Compute the exponent of `factor` directly, rather than dividing in a loop
+        if not math.isfinite(temp_size) or temp_size < factor:  # e.g. NaN or infinity
+            exp = 0
+        else:
+            if binary is True:
+                exp = min(int(math.log2(temp_size)) // 10, len(units))
+            else:
+                exp = min(int(math.log10(temp_size)) // 3, len(units))
+            if exp < len(units) and temp_size >= powers[exp + 1]:  # Guard against rounding errors
+                exp += 1
+            elif exp > 0 and temp_size < powers[exp]:
+                exp -= 1
+
+        mantissa = size / powers[exp]  # The sign (if negative) is kept by the format spec
+        unit = min_unit if exp == 0 else units[exp - 1]
+        parsed_size = f"{mantissa:.{precision}f} {unit}"
+
+    return parsed_size
+
+
+def parse_sizes(sizes, binary=True, precision=1):
+    """
+    Parses an array of sizes (in byte) into human-readable format.
+
+    This is a vectorised counterpart of :func:`~pyhelpers.ops.parse_size` for numerical sizes,
+    which is more efficient for converting a large number of sizes (e.g. a column of a dataframe).
+
+    :param sizes: Array-like object of sizes in byte.
+    :type sizes: numpy.ndarray | pandas.Series | list | tuple
+    :param binary: Whether to use binary (factorised by 1024) or decimal (factorised by 10 ** 3)
+        representation; defaults to ``True`` for binary representation.
+    :type binary: bool
+    :param precision: Number of decimal places when converting ``sizes`` to human-readable format;
+        defaults to ``1``.
+    :type precision: int
+    :return: Sizes in human-readable format.
+    :rtype: numpy.ndarray
+
+    **Examples**::
+
+        >>> from pyhelpers.ops import parse_sizes
+        >>> parse_sizes([0, 1023, 129446707], precision=2)
+        array(['0.00 B', '1023.00 B', '123.45 MiB'], dtype='<U11')
+        >>> parse_sizes([0, 1023, 129446707], binary=False, precision=2)
+        array(['0.00 B', '1.02 KB', '129.45 MB'], dtype='<U9')
+    """
+
     if binary is True:  # Binary system
-        factor, units = 2 ** 10, [x + 'i' + min_unit for x in units_prefixes]
+        factor, units, powers = 2 ** 10, _BIN_UNITS, _BIN_POWERS
     else:  # Decimal (or metric) system
-        factor, units = 10 ** 3, [x + min_unit for x in units_prefixes]
+        factor, units, powers = 10 ** 3, _DEC_UNITS, _DEC_POWERS
 
-    if isinstance(size, str):
-        val, sym = [x.strip() for x in size.split()]
-        if re.match(r'.*i[Bb]', sym):
-            factor, units = 2 ** 10, [x + 'i' + min_unit for x in units_prefixes]
-        unit = [s for s in units if s[0] == sym[0].upper()][0]
+    all_units = np.array(('B',) + units)
+    powers = np.array(powers, dtype=np.float64)
 
-        unit_dict = dict(zip(units, [factor ** i for i in range(1, len(units) + 1)]))
-        parsed_size = int(float(val) * unit_dict[unit])  # in byte
+    arr = np.asarray(sizes, dtype=np.float64)
+    abs_arr = np.abs(arr)
 
-    else:
-        is_negative = size < 0
-        temp_size, parsed_size = map(copy.copy, (abs(size), size))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exp = np.floor(np.log(abs_arr) / np.log(factor))
+    is_finite = np.isfinite(exp)  # Zero, NaN or infinity is kept in 'B'
+    exp = np.clip(np.where(is_finite, exp, 0), 0, len(units)).astype(np.intp)
 
-        for unit in [min_unit] + units:
-            if abs(temp_size) < factor:
-                parsed_size = f"{'-' if is_negative else ''}{temp_size:.{precision}f} {unit}"
-                break
-            if unit != units[-1]:
-                temp_size /= factor
+    # Guard against rounding errors of the logarithm at exact powers of `factor`
+    exp += is_finite & (exp < len(units)) & (abs_arr >= powers[np.minimum(exp + 1, len(units))])
+    exp -= (exp > 0) & (abs_arr < powers[exp])
 
-    return parsed_size
+    mantissa = arr / powers[exp]
+    parsed_sizes = np.char.add(np.char.mod(f'%.{precision}f ', mantissa), all_units[exp])
+
+    return parsed_sizes
 
 
 def get_number_of_chunks(file_or_obj, chunk_size_limit=50, binary=True):
@@ -221,19 +361,73 @@ def get_number_of_chunks(file_or_obj, chunk_size_limit=50, binary=True):
     else:
         size = sys.getsizeof(file_or_obj)
 
-    file_size_in_mb = round(size / (factor ** 2), 1)
-
     if chunk_size_limit:
-        if file_size_in_mb > chunk_size_limit:
-            number_of_chunks = math.ceil(file_size_in_mb / chunk_size_limit)
-        else:
+        # Use integer arithmetic (in byte) to avoid floating-point errors at the boundary
+        chunk_bytes = int(chunk_size_limit * factor * factor)
+        if chunk_bytes <= 0 or size <= chunk_bytes:
             number_of_chunks = 1
+        else:
+            number_of_chunks = (size + chunk_bytes - 1) // chunk_bytes
     else:
         number_of_chunks = None
 
     return number_of_chunks
 
 
+def _quartiles(num_dat):
+    """
+    Calculates the first and third quartiles of numerical data.
+
+    Data of any type other than float or integer is passed on to `numpy.percentile()`_.
+
+    The quartiles are located with a single call to `numpy.partition()`_ (rather than a full sort)
+    and then linearly interpolated in the same way as the default method of `numpy.percentile()`_.
+
+    :param num_dat: Array-like object containing numerical data.
+    :type num_dat: array-like
+    :return: The first and third quartiles of ``num_dat``.
+    :rtype: tuple
+
+    .. _`numpy.partition()`: https://numpy.org/doc/stable/reference/generated/numpy.partition.html
+    .. _`numpy.percentile()`: https://numpy.org/doc/stable/reference/generated/numpy.percentile.html
+
+    **Tests**::
+
+        >>> from pyhelpers.ops.comp import _quartiles
+        >>> q1, q3 = _quartiles(range(100))
+        >>> q1, q3
+        (np.float64(24.75), np.float64(74.25))
+    """
+
+    arr = np.asarray(num_dat)
+    if arr.dtype.kind not in 'fiu':  # e.g. datetime64 (or invalid) data is left to numpy
+        return tuple(np.percentile(arr, [25, 75]))
+
+    arr = np.ascontiguousarray(arr, dtype=np.float64).ravel()
+
+    n = arr.size
+    if n == 0:
+        return tuple(np.percentile(arr, [25, 75]))
+
+    pos = (n - 1) * np.array([0.25, 0.75])
+    lo = pos.astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+
+    # Also place the maximum at the end, so that any NaN (sorted as the largest) can be detected
+    part = np.partition(arr, np.unique(np.concatenate((lo, hi, [n - 1]))))
+    if np.isnan(part[-1]):
+        return np.float64(np.nan), np.float64(np.nan)
+
+    # Interpolate as `numpy.lib._function_base_impl._lerp()`, so that infinite values are
+    # handled in the same way as `numpy.percentile()`
+    a, b, t = part[lo], part[hi], pos - lo
+    with np.errstate(invalid='ignore'):
+        diff_b_a = b - a
+        q1, q3 = np.where(t >= 0.5, b - diff_b_a * (1 - t), a + diff_b_a * t)
+
+    return q1, q3
+
+
 def get_extreme_outlier_bounds(num_dat, k=1.5):
     # noinspection PyShadowingNames
     """
@@ -280,7 +474,7 @@ def get_extreme_outlier_bounds(num_dat, k=1.5):
         (0.0, 148.5)
     """
 
-    q1, q3 = np.percentile(num_dat, 25), np.percentile(num_dat, 75)
+    q1, q3 = _quartiles(num_dat)
     iqr = q3 - q1
 
     lower_bound = np.max([0, q1 - k * iqr])
@@ -310,7 +504,8 @@ def interquartile_range(num_dat):
         49.5
     """
 
-    iqr = np.subtract(*np.percentile(num_dat, [75, 25]))
+    q1, q3 = _quartiles(num_dat)
+    iqr = q3 - q1
 
     return iqr
 
@@ -357,7 +552,31 @@ def find_closest_date(date, lookup_dates, as_datetime=False, fmt='%Y-%m-%d %H:%M
         Timestamp('2019-01-02 00:00:00', freq='D')
     """
 
-    closest_date = min(lookup_dates, key=lambda x: abs(pd.to_datetime(x) - pd.to_datetime(date)))
+    target_date = pd.to_datetime(date)
+
+    if isinstance(lookup_dates, (pd.Index, pd.Series, np.ndarray)):
+        # Keep array-like inputs as an index (rather than a list) for positional look-up
+        lookup_dates = pd.Index(lookup_dates)
+    else:
+        lookup_dates = list(lookup_dates)
+
+    try:
+        if isinstance(lookup_dates, pd.DatetimeIndex):  # No parsing is needed
+            lookup_dates_ = lookup_dates
+        else:  # Parse each date with its own format, as the dates may be in different formats
+            lookup_dates_ = pd.to_datetime(lookup_dates, format='mixed')
+        date_diffs = (lookup_dates_ - target_date).to_numpy()
+    except (TypeError, ValueError):  # e.g. tz-aware dates in different time zones
+        date_diffs = pd.to_timedelta(
+            [pd.to_datetime(x) - target_date for x in lookup_dates]).to_numpy()
+
+    # Find the index of the closest date with vectorised subtraction, ignoring any missing dates
+    is_missing = np.isnat(date_diffs)
+    if is_missing.all():
+        raise ValueError("`lookup_dates` does not contain any valid date.")
+    abs_diffs = np.where(is_missing, np.iinfo(np.int64).max, np.abs(date_diffs).view(np.int64))
+    closest_idx = int(abs_diffs.argmin())
+    closest_date = lookup_dates[closest_idx]
 
     if as_datetime:
         if isinstance(closest_date, str):
@@ -4,9 +4,22 @@ Preferences.
 
 import copy
 import os
+import warnings
 
 from .._cache import _check_dependency
 
+# Fixed options set by `pd_preferences()`, with the default values of pandas commented
+_PD_OPTIONS = {
+    'display.width': 1000,  # 80
+    'display.expand_frame_repr': False,  # True
+    'io.excel.xlsx.writer': 'openpyxl',  # 'auto'
+    'mode.chained_assignment': None,  # 'warn'
+}
+
+# Arguments of the last call to `pd_preferences()` and the options it applied,
+# used to skip a repeated identical call while those options are still in effect
+_PD_STATE = None
+
 
 def pd_preferences(reset=False, max_columns=100, min_rows=10, max_rows=40, precision=4,
                    east_asian_text=False, ignore_future_warning=True, **kwargs):
@@ -119,18 +132,26 @@ def pd_preferences(reset=False, max_columns=100, min_rows=10, max_rows=40, preci
             https://pandas.pydata.org/docs/reference/api/pandas.describe_option.html
     """
 
+    global _PD_STATE
+
     pd = _check_dependency(name='pandas')
 
+    state = (reset, max_columns, min_rows, max_rows, precision, east_asian_text,
+             ignore_future_warning, dict(kwargs))
+    if _PD_STATE is not None and _PD_STATE[0] == state:
+        # Checking the current options is much cheaper than setting (and validating) them again
+        if all(pd.get_option(key) == val for key, val in _PD_STATE[1].items()):
+            return
+
+    _PD_STATE = None
+
     options = {
         'display.max_columns': max_columns,  # 0
         'display.max_rows': max_rows,  # 60
         'display.min_rows': min_rows,  # 10
         'display.precision': precision,  # 6
-        'display.width': 1000,  # 80
         'display.float_format': lambda x: '%.{}f'.format(precision) % x,  # None
-        'display.expand_frame_repr': False,  # True
-        'io.excel.xlsx.writer': 'openpyxl',  # 'auto'
-        'mode.chained_assignment': None,  # 'warn'
+        **_PD_OPTIONS,
     }
 
     if east_asian_text:
@@ -142,14 +163,25 @@ def pd_preferences(reset=False, max_columns=100, min_rows=10, max_rows=40, preci
         for key, val in kwargs.items():
             pd.set_option(key, val)
 
+        _PD_STATE = (state, kwargs)
+
     elif reset is True:
         registered_options = pd._config.config._registered_options
+        default_options = {key: registered_options[key].defval for key in kwargs}
+
+        for key, val in default_options.items():
+            pd.set_option(key, val)
 
-        for key in kwargs:
-            pd.set_option(key, registered_options[key].defval)
+        _PD_STATE = (state, default_options)
 
     elif reset == 'all':
-        pd.reset_option('all', silent=ignore_future_warning)
+        # `silent` of `pandas.reset_option()` was removed in pandas 3.0
+        with warnings.catch_warnings():
+            if ignore_future_warning:
+                # Deprecated options warn with FutureWarning or (in pandas 3+) DeprecationWarning
+                warnings.simplefilter('ignore', category=FutureWarning)
+                warnings.simplefilter('ignore', category=DeprecationWarning)
+            pd.reset_option('all')
 
 
 def np_preferences(reset=False, precision=4, head_tail=5, line_char=120, formatter=None, **kwargs):
@@ -27,13 +27,50 @@ def test_gps_time_to_utc(as_datetime):
         assert utc_dt == '2020-04-20T06:22:47.782251'
 
 
+@pytest.mark.parametrize('as_datetime', [True, False])
+def test_gps_times_to_utc(as_datetime):
+    utc_dts = gps_times_to_utc(
+        gps_times=[1271398985.7822514, 1271398986.7822514], as_datetime=as_datetime)
+
+    if as_datetime:
+        assert utc_dts[0] == np.datetime64('2020-04-20T06:22:47.782251')
+    else:
+        assert utc_dts.tolist() == ['2020-04-20T06:22:47.782251', '2020-04-20T06:22:48.782251']
+
+    rng = np.random.default_rng(0)
+    gps_times = rng.uniform(0, 1.5e9, size=10000)
+    utc_dts = gps_times_to_utc(gps_times, as_datetime=as_datetime, utc_tai_offset=-37)
+    expected = [gps_time_to_utc(t, as_datetime=as_datetime, utc_tai_offset=-37) for t in gps_times]
+    if as_datetime:
+        assert utc_dts.astype(datetime.datetime).tolist() == expected
+    else:
+        assert utc_dts.tolist() == expected
+
+
 def test_parse_size():
     assert parse_size(size='123.45 MB') == 129446707
     assert parse_size(size='123.45 MB', binary=False) == 123450000
     assert parse_size(size='123.45 MiB', binary=True) == 129446707
     assert parse_size(size='123.45 MiB', binary=False) == 129446707
+    assert parse_size(size='123.45\tMB') == 129446707
+    assert parse_size(size=' 123.45 \n MB ') == 129446707
     assert parse_size(size=129446707, precision=2) == '123.45 MiB'
     assert parse_size(size=129446707, binary=False, precision=2) == '129.45 MB'
+    assert parse_size(size=-129446707, precision=2) == '-123.45 MiB'
+    assert parse_size(size=0) == '0.0 B'
+    assert parse_size(size=float('nan')) == 'nan B'
+    assert parse_size(size=float('-inf')) == '-inf B'
+
+
+def test_parse_sizes():
+    sizes = [0, 1023, 129446707, -129446707]
+    assert parse_sizes(sizes, precision=2).tolist() == [
+        '0.00 B', '1023.00 B', '123.45 MiB', '-123.45 MiB']
+    assert parse_sizes(sizes, binary=False, precision=2).tolist() == [
+        '0.00 B', '1.02 KB', '129.45 MB', '-129.45 MB']
+
+    sizes = [float('nan'), float('inf'), float('-inf')]
+    assert parse_sizes(sizes).tolist() == [parse_size(x) for x in sizes]
 
 
 @pytest.mark.parametrize('chunk_size_limit', [0, None, 1, 0.1])
@@ -56,11 +93,44 @@ def test_get_number_of_chunks(chunk_size_limit):
     os.remove(temp_file_path)
 
 
+@pytest.mark.parametrize('binary', [True, False])
+def test_get_number_of_chunks_at_limit(binary):
+    factor = 2 ** 10 if binary else 10 ** 3
+
+    temp_file_ = tempfile.NamedTemporaryFile()
+    temp_file_path = temp_file_.name + ".bin"
+
+    # Exactly at the limit (one chunk) and one byte over it (two chunks)
+    for file_size, expected in [(factor ** 2, 1), (factor ** 2 + 1, 2)]:
+        with open(temp_file_path, 'wb') as f:
+            f.write(b'\0' * file_size)
+
+        number_of_chunks = get_number_of_chunks(temp_file_path, chunk_size_limit=1, binary=binary)
+        assert number_of_chunks == expected
+
+    os.remove(temp_file_path)
+
+
+@pytest.mark.parametrize('num_dat', [
+    list(range(100)), [3.2, -1.5, 7.0, 0.4, 2.2], [1., np.inf, 3.], [np.inf, -np.inf, 1., 2.],
+    [1., 2., np.nan, 4.]])
+def test__quartiles(num_dat):
+    from pyhelpers.ops.comp import _quartiles
+
+    with np.errstate(invalid='ignore'):
+        expected = np.percentile(num_dat, [25, 75])
+    np.testing.assert_array_equal(_quartiles(num_dat), expected)
+
+
 def test_get_extreme_outlier_bounds():
     data = pd.DataFrame(range(100), columns=['col'])
 
     lo_bound, up_bound = get_extreme_outlier_bounds(data, k=1.5)
     assert (lo_bound, up_bound) == (0.0, 148.5)
+    assert isinstance(lo_bound, np.float64) and isinstance(up_bound, np.float64)
+
+    lo_bound, up_bound = get_extreme_outlier_bounds([np.inf, -np.inf, 1., 2.])
+    assert (lo_bound, up_bound) == (0.0, np.inf)
 
 
 def test_interquartile_range():
@@ -68,6 +138,14 @@ def test_interquartile_range():
 
     iqr_result = interquartile_range(data)
     assert iqr_result == 49.5
+    assert isinstance(iqr_result, np.float64)
+
+    dates = np.array(['2019-01-01', '2019-01-05', '2019-02-01', '2019-03-01'], dtype='datetime64[D]')
+    assert interquartile_range(dates) == np.subtract(*np.percentile(dates, [75, 25]))
+    assert interquartile_range(dates).dtype.kind == 'm'
+
+    with pytest.raises(TypeError):
+        interquartile_range([True, False, True])
 
 
 def test_find_closest_date():
@@ -81,12 +159,40 @@ def test_find_closest_date():
     closest_example_date = find_closest_date(example_date, example_dates, as_datetime=True)
     assert closest_example_date == pd.to_datetime('2019-01-02 00:00:00')
 
+    closest_example_date = find_closest_date(example_date, pd.Series(example_dates))
+    assert closest_example_date == '2019-01-02 00:00:00.000000'
+
     example_dates = ['2019-01-02', '2019-12-31']
 
     example_date = '2019-01-01'
     closest_example_date = find_closest_date(example_date, example_dates, as_datetime=True)
     assert closest_example_date == pd.to_datetime('2019-01-02 00:00:00')
 
+    example_date = '2019-01-03'
+    for example_dates in (['2019-01-02', '2019-12-31 10:00:00'], ['2019-01-02', '02/01/2019']):
+        closest_example_date = find_closest_date(example_date, example_dates)
+        assert closest_example_date == '2019-01-02'
+
+    example_dates = [
+        pd.Timestamp('2019-01-02', tz='Europe/London'), pd.Timestamp('2019-01-05', tz='Asia/Tokyo')]
+    closest_example_date = find_closest_date(
+        pd.Timestamp('2019-01-03', tz='UTC'), example_dates, as_datetime=True)
+    assert closest_example_date == example_dates[0]
+
+    example_dates = [pd.Timestamp('2019-01-02'), None, pd.Timestamp('2019-01-05')]
+    closest_example_date = find_closest_date(example_date, example_dates, as_datetime=True)
+    assert closest_example_date == pd.Timestamp('2019-01-02')
+
+    example_dates = pd.Series(['2019-01-02', '02/01/2019', '2019-12-31 10:00:00'], index=[3, 2, 1])
+    closest_example_date = find_closest_date(example_date, example_dates)
+    assert closest_example_date == '2019-01-02'
+
+    closest_example_date = find_closest_date(example_date, ['2019-01-02', pd.NaT])
+    assert closest_example_date == '2019-01-02'
+
+    with pytest.raises(ValueError):
+        find_closest_date(example_date, [None, pd.NaT])
+
 
 # ==================================================================================================
 # gen - Miscellaneous operations.
@@ -40,5 +40,24 @@ def test_pd_preferences(reset, east_asian_text, ignore_future_warning):
         reset=reset, east_asian_text=east_asian_text, ignore_future_warning=ignore_future_warning)
 
 
+def test_pd_preferences_repeated_call(monkeypatch):
+    import pandas as pd
+
+    pd_preferences(max_columns=6)
+
+    set_options = []
+    with monkeypatch.context() as m:
+        m.setattr(pd, 'set_option', lambda *args, **kwargs: set_options.append(args))
+        pd_preferences(max_columns=6)  # Nothing to do, as the same options are still in effect
+    assert not set_options
+
+    pd.reset_option('display.width')  # Options altered elsewhere are applied again
+    pd_preferences(max_columns=6)
+    assert pd.get_option('display.width') == 1000
+
+    pd_preferences(reset=True)
+    assert pd.get_option('display.width') == 80
+
+
 if __name__ == '__main__':
     pytest.main()